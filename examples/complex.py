@@ -6,10 +6,9 @@
 - The green car is not owned by anybody"""
 
 from __future__ import annotations
-from configparser import ConfigParser
 from typing import Any, Optional
 
-from vivify import Vivifiable, Vivifier
+from vivify import FastConfigParser, Vivifiable, Vivifier
 
 
 class HexColour(Vivifiable):
@@ -34,8 +33,8 @@ class Person(object):
 
 
 # read in the data from the config file
-# allow_no_value=True allows for the empty optional attributes to be none
-config: ConfigParser = ConfigParser(allow_no_value=True)
+# options without values are read as none for the empty optional attributes
+config: FastConfigParser = FastConfigParser()
 config.read_string(
     """
     [main]
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-from configparser import ConfigParser
-
-from vivify import Vivifiable, Vivifier
+from vivify import FastConfigParser, Vivifiable, Vivifier
 
 
 class V(list[int], Vivifiable):
@@ -21,7 +19,7 @@ class B(object):
 
 
 # initialise the config parser and read the ini file
-config = ConfigParser()
+config = FastConfigParser()
 with open("example.ini") as f:
     config.read_file(f)
 
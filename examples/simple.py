@@ -8,10 +8,9 @@ How old is Alice?
 
 https://www.daviddarling.info/encyclopedia/A/age_puzzles_and_tricks.html"""
 
-from configparser import ConfigParser
 from typing import Optional
 
-from vivify import Vivifier
+from vivify import FastConfigParser, Vivifier
 
 
 class Person(object):
@@ -22,8 +21,8 @@ class Person(object):
 
 
 # read in the data from the config file
-# note that allow_no_value=True allows for the empty optional age to be none
-config: ConfigParser = ConfigParser(allow_no_value=True)
+# note that an option without a value allows the empty optional age to be none
+config: FastConfigParser = FastConfigParser()
 config.read_string(
     """
     [main]
@@ -7,10 +7,9 @@ allow for for more complex types. This small example shows how we can use the
 Vivifiable mixin to support more complex types.
 """
 
-from configparser import ConfigParser
 from typing import Any
 
-from vivify import Vivifiable, Vivifier
+from vivify import FastConfigParser, Vivifiable, Vivifier
 
 
 class Names(list[str], Vivifiable):
@@ -20,7 +19,7 @@ class Names(list[str], Vivifiable):
 
     @classmethod
     def vivify(cls, object: Any) -> Any:
-        return cls(map(str.strip, object.split(Ages.SEPARATOR)))
+        return cls(map(str.strip, object.split(Names.SEPARATOR)))
 
 
 class Ages(list[int], Vivifiable):
@@ -41,7 +40,7 @@ class People(object):
 
 
 # read in the data from the config file
-config: ConfigParser = ConfigParser()
+config: FastConfigParser = FastConfigParser()
 config.read_string(
     """
     [main]
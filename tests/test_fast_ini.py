@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from configparser import MissingSectionHeaderError, ParsingError
+
+import pytest
+from vivify.fast_ini import FastConfigParser, parse
+
+
+def test_fast_ini_parse():
+    """Test parsing sections and options from an INI string."""
+    assert (
+        parse(
+            """
+        [main]
+        a = A
+        b: B
+        ; comment
+        # c = C
+        [a]
+        integer = 1
+        url = http://localhost:80
+        empty =
+        optional
+        """
+        )
+        == {
+            "main": {"a": "A", "b": "B"},
+            "a": {
+                "integer": "1",
+                "url": "http://localhost:80",
+                "empty": "",
+                "optional": None,
+            },
+        }
+    )
+
+    # check empty data and repeated sections
+    assert parse("") == {}
+    assert parse("[a]\n[b]\nx = 1\n[a]\ny = 2") == {
+        "a": {"y": "2"},
+        "b": {"x": "1"},
+    }
+
+    # check crlf line endings
+    assert parse("[a]\r\nx = 1\r\ny\r\n; c\r\n\r\n[b]\r\nz: 2 \r\n") == {
+        "a": {"x": "1", "y": None},
+        "b": {"z": "2"},
+    }
+
+
+def test_fast_ini_parse_invalid():
+    """Test that invalid lines fail to parse rather than being dropped."""
+    with pytest.raises(ParsingError, match=r"\[line  2\]: \[notsection"):
+        parse("[a]\n[notsection\n")
+    with pytest.raises(ParsingError, match=r"\[line  3\]:     2"):
+        parse("[a]\nx = 1,\n    2\n")
+    with pytest.raises(ParsingError, match="test.ini"):
+        FastConfigParser().read_string("[a]\n[b] c\n", source="test.ini")
+
+    # check options must follow a section header
+    with pytest.raises(MissingSectionHeaderError, match=r"line: 1"):
+        parse("x = 1\n[a]\ny = 2")
+    with pytest.raises(MissingSectionHeaderError, match=r"line: 2"):
+        parse("; comment\ninvalid [\n[a]\n")
+
+    # check options are only continuations if indented past the previous one
+    assert parse("[a]\n  x = 1\ny = 2\n[b]\n  z = 3\n") == {
+        "a": {"x": "1", "y": "2"},
+        "b": {"z": "3"},
+    }
+
+
+def test_fast_ini_fast_config_parser():
+    """Test reading configuration data with a fast config parser."""
+    config: FastConfigParser = FastConfigParser()
+    config.read_string("[a]\nx = 1\n")
+    config.read_file(["[a]\n", "y = 2\n", "[b]\n"])
+    assert config == {"a": {"x": "1", "y": "2"}, "b": {}}
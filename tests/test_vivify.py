@@ -4,81 +4,133 @@ from configparser import ConfigParser
 from typing import Any, Mapping, Optional, Union
 
 import pytest
-from vivify.vivify import Vivifiable, VivificationError, Vivifier
+from vivify.vivify import (
+    Vivifiable,
+    VivificationError,
+    Vivifier,
+    _hints_for,
+    get_vivifier,
+)
 
 
-def test_vivify__extract_configs():
-    """Test extraction of instance's parameters from a configuration."""
-    # check extraction from a dictionary based config
-    assert Vivifier(types=[])._extract_configs(
-        config={
-            "main": {"foo": "A", "bar": "B"},
-            "DEFAULT": {"x": "0"},
-            "foo": {"x": "1"},
-            "bar": {},
-        },
-        instances="main",
-        defaults="DEFAULT",
-    ) == {"foo": {"x": "1"}, "bar": {"x": "0"}}
-
-    # check extraction from a configparser
+def test_vivify__as_dict_config():
+    """Test conversion of configurations into plain dictionaries."""
     config: ConfigParser = ConfigParser()
     config.read_string(
         """
-        [main]
-        foo = a
-        bar = a
         [DEFAULT]
         x = 0
-        [foo]
-        x = 1
-        [bar]
+        [a]
+        y = 1
         """
     )
-    assert Vivifier(types=[])._extract_configs(
-        config=config, instances="main", defaults="DEFAULT"
-    ) == {
-        "foo": {"x": "1"},
-        "bar": {"x": "0"},
-    }
+    dict_config = Vivifier._as_dict_config(config)
+    assert dict_config == {"DEFAULT": {"x": "0"}, "a": {"x": "0", "y": "1"}}
+    assert all(type(c) is dict for c in dict_config.values())
 
-    # check empty args
-    assert (
-        Vivifier(types=[])._extract_configs(
-            config={},
-            instances="",
-            defaults="",
+    # check plain mappings are unchanged
+    plain_config = {"a": {"y": "1"}}
+    assert Vivifier._as_dict_config(plain_config) is plain_config
+
+
+class TestEmpty(object):
+    pass
+
+
+def test_vivify__hints():
+    """Test that type hints are resolved once and cached per type."""
+
+    class TestHints(object):
+        integer: int
+
+    assert _hints_for(TestHints) == {"integer": int}
+    assert _hints_for(TestHints) is _hints_for(TestHints)
+    assert _hints_for(TestEmpty) == {}
+
+    # check unresolvable forward references only fail when vivifying
+    class TestForward(object):
+        forward: TestUndefined  # noqa: F821
+
+    vivifier = Vivifier([TestForward])
+    with pytest.raises(VivificationError):
+        vivifier.vivify(
+            instances={"a": "TestForward"}, config={"a": {"forward": "b"}}
         )
-        == {}
-    )
 
-    # check with impractical instances and defaults
-    assert (
-        Vivifier(types=[])._extract_configs(
-            config={"a": {"a.a": "1"}, "b": {"b.b": "2"}},
-            instances="a",
-            defaults="b",
+    # check invalid annotations only fail when vivifying
+    class TestInvalidHint(object):
+        invalid: "int +"  # noqa: F722
+
+    vivifier = Vivifier([TestInvalidHint])
+    with pytest.raises(VivificationError) as error:
+        vivifier.vivify(
+            instances={"a": "TestInvalidHint"}, config={"a": {"invalid": "1"}}
         )
-        == {}
-    )
-    assert Vivifier(types=[])._extract_configs(
-        config={"a": {"a.a": "1"}, "b": {"b.b": "2"}},
-        instances="a",
-        defaults="a",
-    ) == {"b": {"a.a": "1", "b.b": "2"}}
+    assert isinstance(error.value.__cause__, SyntaxError)
 
 
-class TestEmpty(object):
-    pass
+def test_vivify__class_plan():
+    """Test classification of attribute types into cached plans."""
+
+    class TestPlan(object):
+        string: str
+        vivifiable: TestVivifiableTuple
+        optional: Optional[int]
+        unsupported: list[int]
+
+    vivifier: Vivifier = Vivifier([TestPlan])
+    assert vivifier._class_plan(TestPlan) == {
+        "string": ("coercible", (str, str)),
+        "vivifiable": (
+            "vivifiable",
+            (TestVivifiableTuple, TestVivifiableTuple.vivify),
+        ),
+        "optional": ("union", ((("coercible", (int, int)),), True)),
+        "unsupported": ("unsupported", list[int]),
+    }
+    assert vivifier._class_plan(TestPlan) is vivifier._class_plan(TestPlan)
+
+    # check union member order is kept for unions which compare equal
+    class TestUnionOrderA(object):
+        union: Union[str, int]
+
+    class TestUnionOrderB(object):
+        union: Union[int, str]
+
+    coercible_int = ("coercible", (int, int))
+    coercible_str = ("coercible", (str, str))
+    plan_a = Vivifier([TestUnionOrderA])._class_plan(TestUnionOrderA)
+    plan_b = Vivifier([TestUnionOrderB])._class_plan(TestUnionOrderB)
+    assert plan_a["union"].payload == ((coercible_int, coercible_str), False)
+    assert plan_b["union"].payload == ((coercible_str, coercible_int), False)
+    vivified = Vivifier([TestUnionOrderA, TestUnionOrderB]).vivify(
+        instances={"a": "TestUnionOrderA", "b": "TestUnionOrderB"},
+        config={"a": {"union": "1"}, "b": {"union": "1"}},
+    )
+    assert vivified["a"].union == 1
+    assert vivified["b"].union == "1"
+
+    # check handlers are bound to the attribute types
+    applier = vivifier._compile_applier(TestPlan)
+    assert applier["optional"].allows_none
+    assert len(applier["optional"].handlers) == 1
+    handler = applier["optional"].handlers[0]
+    assert handler("test_plan", "optional", "1", {}) == 1
+    assert applier is vivifier._compile_applier(TestPlan)
 
 
 def test_vivify__process_attributes_empty():
     """Test setting non-existant attributes."""
-    assert Vivifier([TestEmpty])._process_attributes(
-        instances={"test_empty": "TestEmpty"},
-        config={"test_empty": {"attribute": "test"}},
-        vivified={},
+    test_empty: TestEmpty = TestEmpty()
+    assert (
+        Vivifier([TestEmpty])._process_attributes(
+            instances={"test_empty": "TestEmpty"},
+            config={"test_empty": {"attribute": "test"}},
+            vivified={"test_empty": test_empty},
+        )
+        == 1
     )
+    assert test_empty.attribute == "test"
 
 
 def test_vivify__process_attributes_same():
@@ -87,11 +139,16 @@ def test_vivify__process_attributes_same():
     class TestString(object):
         string: str
 
-    assert Vivifier([TestString])._process_attributes(
-        instances={"test_string": "TestString"},
-        config={"test_string": {"string": "1"}},
-        vivified={},
-    ) == [("test_string", "string", "1")]
+    test_string: TestString = TestString()
+    assert (
+        Vivifier([TestString])._process_attributes(
+            instances={"test_string": "TestString"},
+            config={"test_string": {"string": "1"}},
+            vivified={"test_string": test_string},
+        )
+        == 1
+    )
+    assert test_string.string == "1"
 
 
 def test_vivify__process_attributes_coercible():
@@ -100,11 +157,16 @@ def test_vivify__process_attributes_coercible():
     class TestInteger(object):
         integer: int
 
-    assert Vivifier([TestInteger])._process_attributes(
-        instances={"test_integer": "TestInteger"},
-        config={"test_integer": {"integer": "1"}},
-        vivified={},
-    ) == [("test_integer", "integer", 1)]
+    test_integer: TestInteger = TestInteger()
+    assert (
+        Vivifier([TestInteger])._process_attributes(
+            instances={"test_integer": "TestInteger"},
+            config={"test_integer": {"integer": "1"}},
+            vivified={"test_integer": test_integer},
+        )
+        == 1
+    )
+    assert test_integer.integer == 1
 
 
 class TestVivifiableTuple(Vivifiable):
@@ -113,66 +175,123 @@ class TestVivifiableTuple(Vivifiable):
         return tuple(map(int, object.split(",")))
 
 
+def test_vivify__process_attributes_primitive():
+    """Test setting attributes coerced with specialised functions."""
+
+    class TestPrimitive(object):
+        boolean: bool
+        data: bytes
+
+    a: TestPrimitive = TestPrimitive()
+    b: TestPrimitive = TestPrimitive()
+    assert (
+        Vivifier([TestPrimitive])._process_attributes(
+            instances={"a": "TestPrimitive", "b": "TestPrimitive"},
+            config={
+                "a": {"boolean": "no", "data": "a"},
+                "b": {"boolean": "On"},
+            },
+            vivified={"a": a, "b": b},
+        )
+        == 3
+    )
+    assert a.boolean is False
+    assert a.data == b"a"
+    assert b.boolean is True
+
+    with pytest.raises(VivificationError):
+        Vivifier([TestPrimitive])._process_attributes(
+            instances={"a": "TestPrimitive"},
+            config={"a": {"boolean": "maybe"}},
+            vivified={"a": TestPrimitive()},
+        )
+
+
 def test_vivify__process_attributes_vivifiable():
     """Test setting vivifiable attributes."""
 
     class TestVivifiable(object):
         vivifiable: TestVivifiableTuple
 
-    assert Vivifier([TestVivifiable])._process_attributes(
-        instances={"test_vivifiable": "TestVivifiable"},
-        config={"test_vivifiable": {"vivifiable": "1, 2, 3, 4"}},
-        vivified={},
-    ) == [("test_vivifiable", "vivifiable", (1, 2, 3, 4))]
+    test_vivifiable: TestVivifiable = TestVivifiable()
+    assert (
+        Vivifier([TestVivifiable])._process_attributes(
+            instances={"test_vivifiable": "TestVivifiable"},
+            config={"test_vivifiable": {"vivifiable": "1, 2, 3, 4"}},
+            vivified={"test_vivifiable": test_vivifiable},
+        )
+        == 1
+    )
+    assert test_vivifiable.vivifiable == (1, 2, 3, 4)
+
+    # check errors from vivifying non-union attributes are not suppressed
+    with pytest.raises(ValueError):
+        Vivifier([TestVivifiable])._process_attributes(
+            instances={"test_vivifiable": "TestVivifiable"},
+            config={"test_vivifiable": {"vivifiable": "1, a"}},
+            vivified={"test_vivifiable": TestVivifiable()},
+        )
+    with pytest.raises(VivificationError) as error:
+        Vivifier([TestVivifiable]).vivify(
+            instances={"test_vivifiable": "TestVivifiable"},
+            config={"test_vivifiable": {"vivifiable": "1, a"}},
+        )
+    assert isinstance(error.value.__cause__, ValueError)
 
 
 def test_vivify__process_attributes_union():
     """Test setting union and optional attributes"""
 
-    # check complex union type
+    # check complex union type uses the first handled type in reverse order
     class TestUnion(object):
         union: Union[Optional[int], str, TestVivifiableTuple]
 
-    assert set(
-        Vivifier([TestUnion])._process_attributes(
-            instances={"test_union": "TestUnion"},
-            config={"test_union": {"union": "100"}},
-            vivified={},
-        )
-    ) == set(
-        [
-            ("test_union", "union", 100),
-            ("test_union", "union", "100"),
-            ("test_union", "union", (100,)),
-        ]
+    test_union: TestUnion = TestUnion()
+    Vivifier([TestUnion])._process_attributes(
+        instances={"test_union": "TestUnion"},
+        config={"test_union": {"union": "100"}},
+        vivified={"test_union": test_union},
     )
+    assert test_union.union == (100,)
+
+    # check failed vivification falls back to other union types
+    class TestUnionFallback(object):
+        union: Union[str, TestVivifiableTuple]
+
+    test_union_fallback: TestUnionFallback = TestUnionFallback()
+    Vivifier([TestUnionFallback])._process_attributes(
+        instances={"test_union": "TestUnionFallback"},
+        config={"test_union": {"union": "a, b"}},
+        vivified={"test_union": test_union_fallback},
+    )
+    assert test_union_fallback.union == "a, b"
 
     # check nonetype is handled for empty optional values
     class TestOptionalString(object):
         optional: Optional[str]
 
-    assert Vivifier([TestOptionalString])._process_attributes(
+    test_optional_string: TestOptionalString = TestOptionalString()
+    Vivifier([TestOptionalString])._process_attributes(
         instances={"test_optional_string": "TestOptionalString"},
         config={"test_optional_string": {"optional": ""}},
-        vivified={},
-    ) == [("test_optional_string", "optional", "")]
-    assert Vivifier([TestOptionalString])._process_attributes(
+        vivified={"test_optional_string": test_optional_string},
+    )
+    assert test_optional_string.optional == ""
+    Vivifier([TestOptionalString])._process_attributes(
         instances={"test_optional_string": "TestOptionalString"},
         config={"test_optional_string": {"optional": None}},
-        vivified={},
-    ) == [
-        ("test_optional_string", "optional", None),
-        ("test_optional_string", "optional", "None"),
-    ]
+        vivified={"test_optional_string": test_optional_string},
+    )
+    assert test_optional_string.optional is None
 
     class TestOptionalInteger(object):
         optional: Optional[int]
 
-    with pytest.raises(VivificationError):
+    with pytest.raises(VivificationError, match="Assigned 0 of 1 attribute"):
         Vivifier([TestOptionalInteger])._process_attributes(
             instances={"test_optional_integer": "TestOptionalInteger"},
             config={"test_optional_integer": {"optional": ""}},
-            vivified={},
+            vivified={"test_optional_integer": TestOptionalInteger()},
         )
 
 
@@ -185,7 +304,7 @@ def test_vivify__process_attributes_reference():
 
     test_reference_a: TestReference = TestReference()
     test_reference_b: TestReference = TestReference()
-    assert set(
+    assert (
         Vivifier([TestReference])._process_attributes(
             instances={
                 "test_reference_a": "TestReference",
@@ -200,12 +319,10 @@ def test_vivify__process_attributes_reference():
                 "test_reference_b": {"reference": "test_reference_a"},
             },
         )
-    ) == set(
-        [
-            ("test_reference_a", "reference", test_reference_b),
-            ("test_reference_b", "reference", test_reference_a),
-        ]
+        == 2
     )
+    assert test_reference_a.reference is test_reference_b
+    assert test_reference_b.reference is test_reference_a
 
 
 def test_vivify__process_attributes_unsupported():
@@ -303,6 +420,18 @@ def test_vivify__vivify():
     vivified = Vivifier(types=[TestVivify])._vivify(
         instances="main", config=config, defaults="DEFAULT"
     )
+    assert vivified["a"].string == "test"
+    assert vivified["a"].integer == 1
+    assert vivified["a"].reference == vivified["b"]
+    assert vivified["b"].string == "test"
+    assert vivified["b"].reference == vivified["a"]
+
+    # check defaults are overridden by instance configuration
+    vivified = Vivifier(types=[TestVivify])._vivify(
+        instances={"a": "TestVivify"},
+        config={"DEFAULT": {"integer": "0"}, "a": {"integer": "1"}},
+    )
+    assert vivified["a"].integer == 1
 
 
 def test_vivify_vivify():
@@ -322,6 +451,13 @@ def test_vivify_vivify():
         == {}
     )
 
+    # test unknown type names are skipped
+    assert Vivifier(types=[TestEmpty]).vivify(
+        instances={"a": "Unknown", "b": "TestEmpty"},
+        config={"a": {"integer": "1"}, "b": {}},
+        defaults="",
+    ).keys() == {"b"}
+
     # check unsupported type
     class TestUnsupportedList(object):
         unsupported: list[int]
@@ -352,3 +488,23 @@ def test_vivify_vivify():
             config={"test_unsupported_integer": {"integer": "1"}},
             defaults="",
         )
+
+
+def test_get_vivifier():
+    """Test that vivifiers are shared for the same types."""
+    vivifier: Vivifier = get_vivifier(TestVivify, TestEmpty)
+    assert vivifier.types == {"TestVivify": TestVivify, "TestEmpty": TestEmpty}
+    assert get_vivifier(TestVivify, TestEmpty) is vivifier
+    assert get_vivifier(TestVivify) is not vivifier
+
+
+def test_vivification_error():
+    """Test lazy formatting of vivification error messages."""
+    error: VivificationError = VivificationError("unassigned", 1, 2)
+    assert error.kind == "unassigned"
+    assert error.args == ("unassigned", 1, 2)
+    assert str(error).startswith("Assigned 1 of 2 attribute(s) to objects.")
+    assert str(VivificationError("failed")) == (
+        "Error occurred during vivification."
+    )
+    assert str(VivificationError("Custom message")) == "Custom message"
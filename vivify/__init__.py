@@ -1,8 +1,10 @@
+from vivify.fast_ini import FastConfigParser
 from vivify.vivify import (
     Config,
     Vivifiable,
     VivificationError,
     Vivifier,
+    get_vivifier,
     __author__,
     __copyright__,
     __credits__,
@@ -15,9 +17,11 @@ from vivify.vivify import (
 
 __all__ = [
     "Config",
+    "FastConfigParser",
     "Vivifier",
     "Vivifiable",
     "VivificationError",
+    "get_vivifier",
     "__author__",
     "__copyright__",
     "__credits__",
@@ -0,0 +1,115 @@
+"""Lightweight INI parsing for feeding configurations to a Vivifier."""
+
+from __future__ import annotations
+
+import re
+from configparser import MissingSectionHeaderError, ParsingError
+from sys import intern
+from typing import Final, Iterable, Optional, Pattern
+
+# each line is either a section header, e.g. [section], an option with an
+# optional value, e.g. key = value, key: value or key, a full line comment,
+# blank or otherwise invalid, allowing for CRLF line endings
+LINE_RE: Final[Pattern[str]] = re.compile(
+    r"^(?P<indent>[ \t]*)(?:"
+    r"\[(?P<section>[^\]\r\n]+)\]"
+    r"|(?P<key>[^=:;#\s\[][^=:\r\n]*?)(?:[ \t]*[=:][ \t]*(?P<value>.*?))?"
+    r"|[#;].*?"
+    r"|(?P<invalid>\S.*?)"
+    r")?[ \t\r]*$",
+    re.M,
+)
+
+
+def parse(
+    text: str, source: str = "<string>"
+) -> dict[str, dict[str, Optional[str]]]:
+    """Parse an INI style string into a mapping of sections to options.
+
+    Only the subset of the INI format used for vivification is supported:
+    section headers, single line options delimited by "=" or ":" and full line
+    comments starting with "#" or ";". Options without a delimiter are given a
+    value of None, equivalent to a ConfigParser with allow_no_value=True.
+    Unlike a ConfigParser, option names are not lower cased and values are not
+    interpolated.
+    Section and option names are interned as they are used as keys throughout
+    vivification.
+
+    Args:
+        text (str): INI style configuration data.
+        source (str, optional): Name of the data for error messages. Defaults
+            to "<string>".
+
+    Raises:
+        MissingSectionHeaderError: If there are any options or other lines
+            before the first section header.
+        ParsingError: If any lines are invalid, including lines indented as
+            continuations of a multiline value.
+
+    Returns:
+        dict[str, dict[str, Optional[str]]]: Options for each section.
+    """
+    config: dict[str, dict[str, Optional[str]]] = {}
+    # options of the current section, none before the first section header
+    options: Optional[dict[str, Optional[str]]] = None
+    # indentation of the previous option in the section
+    indent: Optional[int] = None
+    error: Optional[ParsingError] = None
+    for line in LINE_RE.finditer(text):
+        kind = line.lastgroup
+        if kind == "indent":
+            # blank lines and comments
+            continue
+        if kind == "section":
+            options = config.setdefault(intern(line["section"].strip()), {})
+            indent = None
+            continue
+        if options is None:
+            raise MissingSectionHeaderError(
+                source, text.count("\n", 0, line.start()) + 1, line[0]
+            )
+        if kind != "invalid":
+            width = len(line["indent"])
+            if indent is None or width <= indent:
+                options[intern(line["key"])] = line["value"]
+                indent = width
+                continue
+        # invalid lines and continuations of multiline values are unsupported
+        if error is None:
+            error = ParsingError(source)
+        error.append(text.count("\n", 0, line.start()) + 1, line[0])
+    if error is not None:
+        raise error
+    return config
+
+
+class FastConfigParser(dict[str, dict[str, Optional[str]]]):
+    """Minimal, faster alternative to a ConfigParser for vivification.
+
+    Sections are stored as plain dictionaries which can be passed directly to
+    a Vivifier. See parse for details of the supported INI format."""
+
+    def read_string(self, string: str, source: str = "<string>") -> None:
+        """Read configuration data from a string.
+
+        Args:
+            string (str): INI style configuration data.
+            source (str, optional): Name of the data for error messages.
+                Defaults to "<string>".
+        """
+        for section, options in parse(string, source).items():
+            self.setdefault(section, {}).update(options)
+
+    def read_file(
+        self, f: Iterable[str], source: Optional[str] = None
+    ) -> None:
+        """Read configuration data from a file or iterable of lines.
+
+        Args:
+            f (Iterable[str]): Lines of INI style configuration data.
+            source (Optional[str], optional): Name of the data for error
+                messages. Defaults to None, using the name of the file.
+        """
+        if source is None:
+            source = getattr(f, "name", "<???>")
+        self.read_string("".join(f), source)
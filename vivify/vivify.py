@@ -3,15 +3,18 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections import deque
-from configparser import DEFAULTSECT
-from logging import Logger, NullHandler, getLogger
+from configparser import DEFAULTSECT, ConfigParser, RawConfigParser
+from functools import lru_cache, partial, wraps
+from itertools import chain
+from logging import DEBUG, Logger, NullHandler, getLogger
+from sys import intern
 from typing import (
     Any,
     Callable,
     Final,
     Iterable,
     Mapping,
+    NamedTuple,
     Optional,
     TypeVar,
     Union,
@@ -51,18 +54,24 @@ def entry_exit_logging(function: Callable[..., T]) -> Callable[..., T]:
         Callable[..., Any]: Wrapped function.
     """
 
+    @wraps(function)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
         """Wrapped logged function.
 
         Returns:
             Any: Result of calling the wrapped function.
         """
+        # skip all logging when debug messages would be discarded
+        if not log.isEnabledFor(DEBUG):
+            return function(*args, **kwargs)
         log.debug(
-            f"Calling {function.__name__!r} with args {args!r} and kwargs"
-            f" {kwargs!r}"
+            "Calling %r with args %r and kwargs %r",
+            function.__name__,
+            args,
+            kwargs,
         )
         result = function(*args, **kwargs)
-        log.debug(f"Returning value {result!r} from {function.__name__!r}")
+        log.debug("Returning value %r from %r", result, function.__name__)
         return result
 
     return wrapper
@@ -71,11 +80,74 @@ def entry_exit_logging(function: Callable[..., T]) -> Callable[..., T]:
 # convenience config types
 Config = Mapping[str, Mapping[str, Any]]
 
+# kinds of attribute type annotation handled during vivification
+UNSUPPORTED: Final[str] = "unsupported"
+OPTIONAL_NONE: Final[str] = "optional_none"
+VIVIFIABLE: Final[str] = "vivifiable"
+COERCIBLE: Final[str] = "coercible"
+UNION: Final[str] = "union"
+
+# marker for a value which could not be handled for an attribute type
+_UNSET: Final[object] = object()
+
+
+class _FieldPlan(NamedTuple):
+    """Pre-classified type annotation of an attribute.
+
+    For unions the payload is a tuple of the plans of each member type other
+    than the none type, in the order in which they are tried, and whether none
+    is allowed. For vivifiable types it is a tuple of the type and its bound
+    vivify method and for coercible types it is a tuple of the type and its
+    coercion function. Otherwise it is the annotated type."""
+
+    kind: str
+    payload: Any
+
+
+class _FieldApplier(NamedTuple):
+    """Attribute handlers bound to the attribute's annotated types.
+
+    None values are assigned without calling any handlers if allowed."""
+
+    allows_none: bool
+    handlers: tuple[Callable[..., Any], ...]
+
 
 class VivificationError(Exception):
-    """Wrapper exception for issues relating to the vivify library."""
+    """Wrapper exception for issues relating to the vivify library.
+
+    Errors are raised with a kind and the arguments for its message, which is
+    only formatted when the error is converted to a string. Any other kind is
+    treated as the message itself."""
 
-    pass
+    MESSAGES: Final[Mapping[str, str]] = {
+        "unassigned": (
+            "Assigned {} of {} attribute(s) to objects. Attribute types may"
+            " not be suitable for vivification"
+        ),
+        "failed": "Error occurred during vivification.",
+    }
+
+    def __init__(self, kind: str, *args: Any) -> None:
+        """Create a new vivification error.
+
+        Args:
+            kind (str): Kind of error or a message.
+            *args (Any): Arguments for the kind's message.
+        """
+        super().__init__(kind, *args)
+        self.kind: str = kind
+
+    def __str__(self) -> str:
+        """Format the error message.
+
+        Returns:
+            str: Error message.
+        """
+        message = self.MESSAGES.get(self.kind)
+        if message is None:
+            return super().__str__()
+        return message.format(*self.args[1:])
 
 
 class Vivifiable(ABC):
@@ -86,9 +158,10 @@ class Vivifiable(ABC):
     configuration from an INI file using a ConfigParser which will only provide
     a string for all values."""
 
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
-    @entry_exit_logging
     def vivify(cls, object: Any) -> Any:
         """Constructor for create an instance from a configuration value.
 
@@ -101,10 +174,319 @@ class Vivifiable(ABC):
         pass  # pragma: no cover
 
 
+def _set_untyped(t: None, i: str, a: str, v: Any, vivified: Config) -> Any:
+    """Handle an attribute without a type annotation.
+
+    Args:
+        t (None): Unused type, for consistency with other handlers.
+        i (str): Instance name.
+        a (str): Attribute name.
+        v (Any): Configuration value.
+        vivified (Config): Already vivified objects.
+
+    Returns:
+        Any: Configuration value as is.
+    """
+    log.warning(
+        "Adding untyped attribute %r with value %r to instance %r", a, v, i
+    )
+    return v
+
+
+def _set_unsupported(t: Any, i: str, a: str, v: Any, vivified: Config) -> Any:
+    """Handle an attribute with an unsupported generic type annotation.
+
+    Args:
+        t (Any): Unsupported type annotation.
+        i (str): Instance name.
+        a (str): Attribute name.
+        v (Any): Configuration value.
+        vivified (Config): Already vivified objects.
+
+    Returns:
+        Any: Marker for a value which could not be handled.
+    """
+    log.warning("Cannot add attribute with unsupported generic type %r", t)
+    return _UNSET
+
+
+def _set_none(t: type, i: str, a: str, v: Any, vivified: Config) -> Any:
+    """Handle the none type of an optional attribute.
+
+    Args:
+        t (type): None type.
+        i (str): Instance name.
+        a (str): Attribute name.
+        v (Any): Configuration value.
+        vivified (Config): Already vivified objects.
+
+    Returns:
+        Any: None if the value is None, otherwise a marker for a value which
+            could not be handled.
+    """
+    if v is None:
+        log.debug(
+            "Adding attribute %r to instance %r with optional value %r"
+            " matching type %r",
+            a,
+            i,
+            v,
+            t,
+        )
+        return None
+    log.warning(
+        "Cannot add attribute %r to instance %r with value %r because"
+        " optional type does not match %r",
+        a,
+        i,
+        v,
+        t,
+    )
+    return _UNSET
+
+
+def _vivifiable_handler(
+    t: type, vivify: Callable[[Any], Any], fallback: bool
+) -> Callable[[str, str, Any, Config], Any]:
+    """Create a handler for an attribute with a vivifiable type annotation.
+
+    Errors from the vivify method are only suppressed if there is another
+    union member type to fall back to, otherwise they are raised as is.
+
+    Args:
+        t (type): Vivifiable type.
+        vivify (Callable[[Any], Any]): Bound vivify method of the type.
+        fallback (bool): Whether another handler is tried on failure.
+
+    Returns:
+        Callable[[str, str, Any, Config], Any]: Attribute handler.
+    """
+
+    def handle(i: str, a: str, v: Any, vivified: Config) -> Any:
+        """Handle a value for a vivifiable attribute.
+
+        Args:
+            i (str): Instance name.
+            a (str): Attribute name.
+            v (Any): Configuration value.
+            vivified (Config): Already vivified objects.
+
+        Raises:
+            TypeError: If vivification fails without a fallback.
+            ValueError: If vivification fails without a fallback.
+
+        Returns:
+            Any: Vivified value, or a marker for a value which could not be
+                handled.
+        """
+        if isinstance(v, t):
+            log.debug(
+                "Adding attribute %r to instance %r with value %r for matching"
+                " type %r",
+                a,
+                i,
+                v,
+                t,
+            )
+            return v
+        try:
+            log.debug(
+                "Adding vivifiable attribute %r with type %r and value %r to"
+                " instance %r",
+                a,
+                t,
+                v,
+                i,
+            )
+            return vivify(v)
+        except (TypeError, ValueError):
+            if not fallback:
+                raise
+            log.warning(
+                "Failed to add vivifiable attribute %r with type %r and value"
+                " %r to instance %r",
+                a,
+                t,
+                v,
+                i,
+            )
+            return _UNSET
+
+    return handle
+
+
+def _to_bool(v: Any) -> bool:
+    """Coerce a value to a boolean, accepting the same strings as ConfigParser.
+
+    Args:
+        v (Any): Value to coerce.
+
+    Raises:
+        ValueError: If a string value is not a recognised boolean.
+
+    Returns:
+        bool: Coerced value.
+    """
+    if isinstance(v, str):
+        try:
+            return ConfigParser.BOOLEAN_STATES[v.lower()]
+        except KeyError:
+            raise ValueError(f"Not a boolean: {v!r}") from None
+    return bool(v)
+
+
+# coercion functions for primitive types where calling the type is unsuitable
+_COERCERS: Final[Mapping[type, Callable[[Any], Any]]] = {
+    bool: _to_bool,
+    bytes: str.encode,
+}
+
+
+def _coercion_handler(
+    t: type, coerce: Callable[[Any], Any], referable: bool
+) -> Callable[[str, str, Any, Config], Any]:
+    """Create a handler for an attribute with a plain type annotation.
+
+    The value is used directly if it matches the type, then as a reference to
+    another vivified object and finally coerced to the type. The reference
+    lookup is skipped entirely if no vivified object could match the type.
+
+    Args:
+        t (type): Annotated type.
+        coerce (Callable[[Any], Any]): Coercion function for the type.
+        referable (bool): Whether vivified objects may have the type.
+
+    Returns:
+        Callable[[str, str, Any, Config], Any]: Attribute handler.
+    """
+
+    def handle(i: str, a: str, v: Any, vivified: Config) -> Any:
+        """Handle a value for a plain attribute.
+
+        Args:
+            i (str): Instance name.
+            a (str): Attribute name.
+            v (Any): Configuration value.
+            vivified (Config): Already vivified objects.
+
+        Returns:
+            Any: Matching, referenced or coerced value, or a marker for a
+                value which could not be handled.
+        """
+        if isinstance(v, t):
+            log.debug(
+                "Adding attribute %r to instance %r with value %r for matching"
+                " type %r",
+                a,
+                i,
+                v,
+                t,
+            )
+            return v
+        # config values are almost always exact strings, so check the type
+        # directly before looking up references
+        if (
+            referable
+            and type(v) is str
+            and isinstance(reference := vivified.get(v), t)
+        ):
+            log.debug(
+                "Adding attribute %r to instance %r with reference to"
+                " instance %r",
+                a,
+                i,
+                v,
+            )
+            return reference
+        try:
+            log.debug(
+                "Adding attribute %r with value %r to instance %r via coercion"
+                " to type %r",
+                a,
+                v,
+                i,
+                t,
+            )
+            return coerce(v)
+        except (TypeError, ValueError):
+            log.warning(
+                "Failed to add attribute %r to instance %r with value %r via"
+                " coercion to type %r",
+                a,
+                i,
+                v,
+                t,
+            )
+            return _UNSET
+
+    return handle
+
+
+# attribute handlers for kinds of type annotation which need no specialising
+_HANDLERS: Final[Mapping[str, Callable[..., Any]]] = {
+    UNSUPPORTED: _set_unsupported,
+    OPTIONAL_NONE: _set_none,
+}
+
+# handlers for attributes without a type annotation
+_UNTYPED_APPLIER: Final[_FieldApplier] = _FieldApplier(
+    False, (partial(_set_untyped, None),)
+)
+
+
+def _classify(t: Any) -> _FieldPlan:
+    """Classify a type annotation for vivification.
+
+    Args:
+        t (Any): Type annotation of an attribute.
+
+    Returns:
+        _FieldPlan: Plan for handling values of the attribute.
+    """
+    # union members are tried in reverse order, with the first success kept
+    if is_union_type(t):
+        args = get_args(t)
+        return _FieldPlan(
+            UNION,
+            (
+                tuple(
+                    _classify(u)
+                    for u in reversed(args)
+                    if u is not type(None)  # noqa: E721
+                ),
+                type(None) in args,
+            ),
+        )
+    # filter out any unsupported generic types
+    try:
+        isinstance(Any, t)
+    except TypeError:
+        return _FieldPlan(UNSUPPORTED, t)
+    if t is type(None):  # noqa: E721
+        return _FieldPlan(OPTIONAL_NONE, t)
+    if issubclass(t, Vivifiable):
+        return _FieldPlan(VIVIFIABLE, (t, t.vivify))
+    return _FieldPlan(COERCIBLE, (t, _COERCERS.get(t, t)))
+
+
+@lru_cache(maxsize=128)
+def _hints_for(t: type) -> dict[str, Any]:
+    """Resolve the type hints for a type, shared between all vivifiers.
+
+    Args:
+        t (type): Type to get the type hints for.
+
+    Returns:
+        dict[str, Any]: Resolved type hints for the type.
+    """
+    return get_type_hints(t)
+
+
 class Vivifier(object):
     """Handle vivification of objects from configurations."""
 
-    @entry_exit_logging
+    __slots__ = ("types", "_plan_cache", "_applier_cache", "_appliers")
+
     def __init__(self, types: Iterable[type]) -> None:
         """Create a new vivifier instance.
 
@@ -113,178 +495,210 @@ class Vivifier(object):
         """
         self.types: Mapping[str, type]
         if types:
-            self.types = {t.__name__: t for t in types}
+            self.types = {intern(t.__name__): t for t in types}
         else:
             log.warning("Instantiating Vivifier with no valid types")
             self.types = {}
+        # type hints are resolved and classified once per type and reused for
+        # every call
+        self._plan_cache: dict[type, dict[str, _FieldPlan]] = {}
+        self._applier_cache: dict[type, dict[str, _FieldApplier]] = {}
+        # appliers by type name so instances' types need not be looked up
+        self._appliers: dict[str, dict[str, _FieldApplier]] = {}
+        for name, t in self.types.items():
+            try:
+                self._appliers[name] = self._compile_applier(t)
+            except Exception:
+                # forward references may only be resolvable when vivifying and
+                # any other failure is reported as a vivification error then
+                log.debug("Deferring type hint resolution for type %r", t)
 
-    @entry_exit_logging
-    def _extract_configs(
-        self, config: Config, instances: Optional[str], defaults: Optional[str]
-    ) -> Config:
-        """Extract the complete configurations for each object.
+    def _class_plan(self, t: type) -> dict[str, _FieldPlan]:
+        """Get the cached attribute handling plans for a type.
+
+        Args:
+            t (type): Type to get the plans for.
+
+        Returns:
+            dict[str, _FieldPlan]: Plans for each annotated attribute.
+        """
+        plan = self._plan_cache.get(t)
+        if plan is None:
+            plan = self._plan_cache[t] = {
+                intern(a): _classify(h)
+                for a, h in _hints_for(t).items()
+            }
+        return plan
+
+    def _compile_applier(self, t: type) -> dict[str, _FieldApplier]:
+        """Get the cached attribute handlers for a type.
+
+        Each attribute's handlers are specialised for their annotated types
+        from the type's plan so that values can be handled without further
+        dispatch.
 
-        Configuration objects must have a section which provides a mapping from
-        variable name to type name. An optional default section can also be
-        used, as is the case with a ConfigParser. This method extracts the
-        complete configuration for each named object, integrating any defaults.
+        Args:
+            t (type): Type to get the handlers for.
+
+        Returns:
+            dict[str, _FieldApplier]: Handlers for each annotated attribute.
+        """
+        applier = self._applier_cache.get(t)
+        if applier is None:
+            applier = {}
+            for a, plan in self._class_plan(t).items():
+                plans, allows_none = (
+                    plan.payload if plan.kind == UNION else ((plan,), False)
+                )
+                last = len(plans) - 1
+                applier[a] = _FieldApplier(
+                    allows_none,
+                    tuple(
+                        self._compile_handler(kind, payload, n < last)
+                        for n, (kind, payload) in enumerate(plans)
+                    ),
+                )
+            self._applier_cache[t] = applier
+        return applier
+
+    def _compile_handler(
+        self, kind: str, payload: Any, fallback: bool = False
+    ) -> Callable[[str, str, Any, Config], Any]:
+        """Create a handler specialised for a classified type annotation.
+
+        Args:
+            kind (str): Kind of the type annotation.
+            payload (Any): Payload of the type annotation's plan.
+            fallback (bool, optional): Whether another handler is tried if
+                this one fails. Defaults to False.
+
+        Returns:
+            Callable[[str, str, Any, Config], Any]: Attribute handler.
+        """
+        if kind == VIVIFIABLE:
+            return _vivifiable_handler(*payload, fallback)
+        if kind == COERCIBLE:
+            t, coerce = payload
+            # only objects of the valid types can be referenced
+            referable = any(issubclass(r, t) for r in self.types.values())
+            return _coercion_handler(t, coerce, referable)
+        return partial(_HANDLERS[kind], payload)
+
+    @staticmethod
+    def _as_dict_config(config: Config) -> Config:
+        """Convert a configuration into plain nested dictionaries.
+
+        Sections of a ConfigParser are proxies which look up and interpolate
+        values on every access, so they are read into dictionaries once up
+        front, interning the section and option names as they are copied.
+        Other configurations are returned unchanged.
 
         Args:
-            config (Config): Configuration for all objects.
-            instances (Optional[str]): Name key of the instance section.
-            defaults (Optional[str]): Name key of the default section.
+            config (Config): Configuration to convert.
 
         Returns:
-            Config: Extracted configuration.
+            Config: Configuration as plain mappings.
         """
-        return {
-            s: {
-                **(config[defaults] if defaults and defaults in config else {}),
-                **config[s],
+        if isinstance(config, RawConfigParser):
+            return {
+                intern(s): {intern(k): v for k, v in config[s].items()}
+                for s in config
             }
-            for s in config
-            if s and s != instances and s != defaults
-        }
+        return config
 
-    @entry_exit_logging
     def _process_attributes(
         self,
         instances: Mapping[str, str],
         config: Config,
         vivified: Mapping[str, Any],
-    ) -> Iterable[tuple[str, str, Any]]:
+        defaults: Optional[Mapping[str, Any]] = None,
+    ) -> int:
         """Process all instance attributes specified in the configuration.
 
-        This will attempt to create a list of values to be assigned to
-        attributes and may include duplicate attributes with different values in
-        the case of union or optional types, e.g. Union[int, str] with config
-        entry 1 would include the string and integer versions.
+        This will attempt to set each attribute directly on its vivified
+        object. For union or optional types only the value from the first
+        member type which can handle the config entry is set, with None taking
+        precedence for optional types and otherwise the member types tried in
+        reverse order, e.g. Union[int, str] with config entry 1 would set only
+        the string version. Default attributes are processed for each instance
+        unless they are overridden by the instance's configuration, so every
+        attribute is visited once.
 
         Args:
             instances (Mapping[str, str]): Instance names and types.
             config (Config): Instance attribute configuration.
             vivified (Mapping[str, Any]): Already vivified objects.
+            defaults (Optional[Mapping[str, Any]], optional): Default attribute
+                configuration for all instances. Defaults to None.
 
         Raises:
             VivificationException: On failure to assign all attributes.
 
         Returns:
-            Iterable[tuple[str, str, Any]]: Processed attributes for adding.
+            int: Number of attributes set.
         """
-        types = {k: get_type_hints(v) for k, v in self.types.items()}
-        queue: deque[tuple[str, str, str, Optional[type]]] = deque(
-            (
-                (i, a, v, types[instances[i]].get(a, None))
-                for i, c in config.items()
-                for a, v in c.items()
-                if i in instances
-            )
-        )
-        log.debug(f"Attribute processing queue initialised as {queue!r}")
-        queue_length: int = len(queue)
-        setters: Iterable[tuple[str, str, Any]] = []
-        seen: set[tuple[str, str]] = set()
-        while queue:
-            # fetch an instance's attribute data from the queue
-            t: Optional[type]
-            i, a, v, t = queue.pop()
-            log.info(
-                f"Handling attribute {t!r} for instance {i!r} with value"
-                f" {v!r} and type {t!r}"
-            )
-
-            # for unions add the attribute with all possible types to the queue
-            if is_union_type(t):
-                log.debug(f"Expanding and adding union type {t!r}")
-                queue.extend((i, a, v, t) for t in get_args(t))
+        total: int = 0
+        assigned: int = 0
+        # bind lookups used in the loop to locals
+        get_type = self.types.get
+        get_type_name = instances.get
+        get_type_applier = self._appliers.get
+        compile_applier = self._compile_applier
+        unset = _UNSET
+        untyped = _UNTYPED_APPLIER
+        for i, c in config.items():
+            # objects without any attribute configuration need no handling
+            if not c and not defaults:
                 continue
-
-            # filter out any unsupported generic types
-            try:
-                if t is not None and isinstance(Any, t):
-                    pass
-            except TypeError:
-                log.warning(
-                    f"Cannot add attribute with unsupported generic type {t!r}"
+            name = get_type_name(i)
+            applier = get_type_applier(name)
+            if applier is None:
+                # handle types with deferred type hint resolution
+                t = get_type(name)
+                if t is None:
+                    continue
+                applier = compile_applier(t)
+            get_applier = applier.get
+            attributes: Iterable[tuple[str, Any]] = c.items()
+            if defaults:
+                attributes = chain(
+                    attributes,
+                    ((a, v) for a, v in defaults.items() if a not in c),
                 )
-                continue
-
-            # handle untyped attributes
-            if t is None:
-                log.warning(
-                    f"Adding untyped attribute {a!r} with value {v!r} to"
-                    f" instance {i!r}"
+            for a, v in attributes:
+                total += 1
+                log.info(
+                    "Handling attribute %r for instance %r with value %r",
+                    a,
+                    i,
+                    v,
                 )
-                setters.append((i, a, v))
-                seen.add((i, a))
-            # handle none for optional types
-            elif t is type(None):  # noqa: E721
-                if v is None:
+                allows_none, handlers = get_applier(a, untyped)
+                if allows_none and v is None:
                     log.debug(
-                        f"Adding attribute {a!r} to instance {i!r} with"
-                        f" optional value {v!r} matching type {t!r}"
+                        "Adding attribute %r to instance %r with optional"
+                        " value None",
+                        a,
+                        i,
                     )
-                    setters.append((i, a, None))
-                    seen.add((i, a))
+                    value = None
                 else:
-                    log.warning(
-                        f"Cannot add attribute {a!r} to instance {i!r} with"
-                        f" value {v!r} because optional type does not match"
-                        f" {t!r}"
-                    )
-            # value already matches annotated type
-            elif isinstance(v, t):
-                log.debug(
-                    f"Adding attribute {a!r} to instance {i!r} with value {v!r}"
-                    f" for matching type {t!r}"
-                )
-                setters.append((i, a, v))
-                seen.add((i, a))
-            # type is vivifiable
-            elif issubclass(t, Vivifiable):
-                log.debug(
-                    f"Adding vivifiable attribute {a!r} with type {t!r} and"
-                    f" value {v!r} to instance {i!r}"
-                )
-                setters.append((i, a, t.vivify(v)))
-                seen.add((i, a))
-            # type is a reference
-            elif (
-                isinstance(v, str)
-                and v in vivified
-                and isinstance(vivified[v], t)
-            ):
-                log.debug(
-                    f"Adding attribute {a!r} to instance {i!r} with reference"
-                    f" to instance {v!r}"
-                )
-                setters.append((i, a, vivified[v]))
-                seen.add((i, a))
-            # attempt to coerce the type
-            else:
-                try:
-                    log.debug(
-                        f"Adding attribute {a!r} with value {v!r} to instance"
-                        f" {i!r} via coercion to type {t!r}"
-                    )
-                    setters.append((i, a, t(v)))
-                    seen.add((i, a))
-                except (TypeError, ValueError):
-                    log.warning(
-                        f"Failed to add attribute {a!r} to instance {i!r} with"
-                        f" value {v!r} via coercion to type {t!r}"
-                    )
+                    # use the first member type of unions to handle the value
+                    for handler in handlers:
+                        value = handler(i, a, v, vivified)
+                        if value is not unset:
+                            break
+                    else:
+                        continue
+                setattr(vivified[i], a, value)
+                assigned += 1
 
         # verify that the correct number of possible attributes have been set
-        if len(seen) < queue_length:
-            raise VivificationError(
-                f"Assigned {len(seen)} of {queue_length} attribute(s) to"
-                " objects. Attribute types may not be suitable for vivification"
-            )
+        if assigned < total:
+            raise VivificationError("unassigned", assigned, total)
 
-        return setters
+        return assigned
 
-    @entry_exit_logging
     def _vivify(
         self,
         instances: Union[Mapping[str, str], str],
@@ -305,42 +719,51 @@ class Vivifier(object):
         Returns:
             Mapping[str, Any]: All vivified objects.
         """
+        # read sections into plain mappings so they can be fetched with get
+        config = self._as_dict_config(config)
         # store for vivified objects
-        vivified: Mapping[str, Any] = {}
+        vivified: dict[str, Any] = {}
         # store for instances name and type data
         instances_config: Mapping[str, str]
 
-        instances_is_str: bool = isinstance(instances, str)
+        instances_is_str: bool = type(instances) is str
         # get the instances data
         if instances_is_str:
-            if instances in config:
-                instances_config = config[instances]
-            else:
-                instances_config = {}
+            instances_config = config.get(instances, {})
         else:
             instances_config = instances
 
-        # extract just the attribute configuration data
-        if defaults or instances_is_str:
-            config = self._extract_configs(
-                config=config,
-                instances=instances if instances_is_str else None,
-                defaults=defaults,
-            )
+        # get the defaults applied to all objects
+        default_config: Mapping[str, Any] = (
+            config.get(defaults, {}) if defaults else {}
+        )
 
-        # create all objects and set the attributes
-        vivified = {
-            v: self.types[instances_config[v]]()
-            for v in config
-            if v in instances_config
-        }
-        seen: set[tuple[str, str]] = set()
-        for instance, attribute, value in self._process_attributes(
-            instances_config, config, vivified
-        ):
-            if (instance, attribute) not in seen:
-                seen.add((instance, attribute))
-                setattr(vivified[instance], attribute, value)
+        # first create all objects so that references can be resolved, noting
+        # the configuration of each so other sections are not processed again
+        instance_types: dict[str, str] = {}
+        instance_configs: dict[str, Mapping[str, Any]] = {}
+        get_type = self.types.get
+        get_type_name = instances_config.get
+        for v, c in config.items():
+            if not v or v == defaults or (instances_is_str and v == instances):
+                continue
+            name = get_type_name(v)
+            if name is None:
+                continue
+            t = get_type(name)
+            if t is None:
+                log.warning(
+                    "Skipping instance %r with unknown type %r", v, name
+                )
+                continue
+            instance_types[v] = name
+            instance_configs[v] = c
+            vivified[v] = t()
+        # then set all attribute values, merging in the defaults as they are
+        # processed
+        self._process_attributes(
+            instance_types, instance_configs, vivified, default_config
+        )
         return vivified
 
     @entry_exit_logging
@@ -364,13 +787,32 @@ class Vivifier(object):
         Returns:
             Mapping[str, Any]: All vivified objects.
         """
+        # nothing can be vivified without instances and their configuration
+        if not instances or not config:
+            return {}
         try:
             return self._vivify(
-                instances=instances, config=config, defaults=defaults
+                instances=instances,
+                config=config,
+                defaults=defaults,
             )
         except VivificationError:
             raise
         except Exception as error:
-            raise VivificationError(
-                "Error occurred during vivification."
-            ) from error
+            raise VivificationError("failed") from error
+
+
+@lru_cache(maxsize=None)
+def get_vivifier(*types: type) -> Vivifier:
+    """Get a shared vivifier for the given types.
+
+    Vivifiers are cached by their types so that type hints and attribute
+    handlers are only prepared once for each combination of types.
+
+    Args:
+        *types (type): Valid types for vivification.
+
+    Returns:
+        Vivifier: Vivifier for the types.
+    """
+    return Vivifier(types=types)